@@ -1,99 +1,133 @@
 """
 HTTP API for event ingestion.
-Zero external dependencies - uses Python standard library only.
+Built on aiohttp - requests are served directly on the asyncio event loop.
 
 Universal endpoint: POST /event
 All event types use the same GenericEvent class!
 """
-import asyncio
 import json
 import logging
-from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Callable, Optional
 
+from aiohttp import web
+
+from core.event import EventPriority
 from core.generic_event import GenericEvent
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to stdlib json
+    orjson = None
 
-logger = logging.getLogger(__name__)
 
+logger = logging.getLogger(__name__)
 
-class EventAPIHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for event API."""
-
-    # Class variables
-    event_publisher: Optional[Callable] = None
-    event_loop: Optional[asyncio.AbstractEventLoop] = None
-
-    def log_message(self, format, *args):
-        """Override to use Python logging instead of printing to stderr."""
-        logger.info("%s - %s" % (self.address_string(), format % args))
-
-    def _send_json_response(self, status_code: int, data: dict) -> None:
-        """Send JSON response."""
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode('utf-8'))
-
-    def _send_error_response(self, status_code: int, message: str) -> None:
-        """Send error response."""
-        self._send_json_response(status_code, {"error": message})
-
-    def do_GET(self):
-        """Handle GET requests."""
-        if self.path == '/health':
-            self._send_json_response(200, {
-                "status": "healthy",
-                "service": "crypto-alert-system"
-            })
-        elif self.path == '/':
-            self._send_json_response(200, {
-                "service": "Crypto Alert System API",
-                "version": "3.0",
-                "usage": "POST /event with JSON body: {\"event_type\": \"...\", \"data\": {...}, \"priority\": \"HIGH\"}",
-                "endpoints": {
-                    "POST /event": "Universal endpoint - all events use GenericEvent",
-                    "GET /health": "Health check"
-                },
-                "example": {
-                    "event_type": "price_alert",
-                    "data": {"symbol": "BTC/USDT", "price": "$45,000", "change": "+5.3%"},
-                    "priority": "HIGH",
-                    "notify_threshold": {"field": "change", "abs_gte": 2.0}
-                }
-            })
-        else:
-            self._send_error_response(404, "Endpoint not found")
-
-    def do_POST(self):
-        """Handle POST requests - Universal event endpoint."""
-        if not self.event_publisher:
-            self._send_error_response(500, "Event publisher not configured")
-            return
 
-        # Only one endpoint needed!
-        if self.path != '/event':
-            self._send_error_response(404, f"Endpoint not found. Use POST /event")
-            return
+def _dumps(data) -> bytes:
+    """Serialize data to JSON bytes."""
+    if orjson:
+        # orjson returns bytes directly - no intermediate str
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads(body: bytes):
+    """Parse JSON from raw request bytes."""
+    if orjson:
+        # orjson parses UTF-8 bytes natively, skipping the decode step
+        return orjson.loads(body)
+    return json.loads(body.decode('utf-8'))
+
+
+# Static GET responses, encoded once at import
+_HEALTH_BODY = _dumps({
+    "status": "healthy",
+    "service": "crypto-alert-system"
+})
+_ROOT_BODY = _dumps({
+    "service": "Crypto Alert System API",
+    "version": "3.0",
+    "usage": "POST /event with JSON body: {\"event_type\": \"...\", \"data\": {...}, \"priority\": \"HIGH\"}",
+    "endpoints": {
+        "POST /event": "Universal endpoint - all events use GenericEvent",
+        "GET /health": "Health check"
+    },
+    "example": {
+        "event_type": "price_alert",
+        "data": {"symbol": "BTC/USDT", "price": "$45,000", "change": "+5.3%"},
+        "priority": "HIGH",
+        "notify_threshold": {"field": "change", "abs_gte": 2.0}
+    }
+})
+
+# Constant pieces of the POST /event success body
+_OK_PREFIX = b'{"status":"success","message":'
+_OK_EVENT_TYPE = b',"event_type":'
+_OK_WILL_NOTIFY = {True: b',"will_notify":true,"priority":', False: b',"will_notify":false,"priority":'}
+_OK_PRIORITY = {p.name: b'"' + p.name.encode() + b'"}' for p in EventPriority}
+
+
+def _success_body(event_type, will_notify: bool, priority_name: str) -> bytes:
+    """Assemble the POST /event success body without building a dict."""
+    return b''.join((
+        _OK_PREFIX,
+        _dumps(f"Event '{event_type}' published successfully"),
+        _OK_EVENT_TYPE,
+        _dumps(event_type),
+        _OK_WILL_NOTIFY[bool(will_notify)],
+        _OK_PRIORITY[priority_name],
+    ))
 
-        # Parse request body
-        content_length = int(self.headers.get('Content-Length', 0))
-        if content_length == 0:
-            self._send_error_response(400, "Empty request body")
-            return
 
-        try:
-            body = self.rfile.read(content_length)
-            data = json.loads(body.decode('utf-8'))
-        except json.JSONDecodeError:
-            self._send_error_response(400, "Invalid JSON")
-            return
+class EventAPIServer:
+    """HTTP server for event API."""
 
-        # Handle the event
-        self._handle_universal_event(data)
+    def __init__(self, host: str = 'localhost', port: int = 8080, event_publisher: Optional[Callable] = None):
+        """
+        Initialize API server.
 
-    def _handle_universal_event(self, data: dict) -> None:
+        Args:
+            host: Server host
+            port: Server port
+            event_publisher: Async function to publish events to event bus
+        """
+        self.host = host
+        self.port = port
+        self.event_publisher = event_publisher
+        self._runner: Optional[web.AppRunner] = None
+
+    def _json_response(self, status_code: int, data: dict) -> web.Response:
+        """Build JSON response."""
+        return self._bytes_response(status_code, _dumps(data))
+
+    def _bytes_response(self, status_code: int, body: bytes) -> web.Response:
+        """Build JSON response from an already-encoded body."""
+        return web.Response(
+            status=status_code,
+            body=body,
+            content_type='application/json',
+            headers={'Access-Control-Allow-Origin': '*'}
+        )
+
+    def _error_response(self, status_code: int, message: str) -> web.Response:
+        """Build error response."""
+        return self._json_response(status_code, {"error": message})
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        """Handle GET /health."""
+        return self._bytes_response(200, _HEALTH_BODY)
+
+    async def _handle_root(self, request: web.Request) -> web.Response:
+        """Handle GET / - API info."""
+        return self._bytes_response(200, _ROOT_BODY)
+
+    async def _handle_not_found(self, request: web.Request) -> web.Response:
+        """Handle unknown endpoints."""
+        if request.method == 'POST':
+            return self._error_response(404, "Endpoint not found. Use POST /event")
+        return self._error_response(404, "Endpoint not found")
+
+    async def _handle_event(self, request: web.Request) -> web.Response:
         """
         Universal event handler - uses GenericEvent for everything!
 
@@ -112,6 +146,20 @@ class EventAPIHandler(BaseHTTPRequestHandler):
             }
         }
         """
+        if not self.event_publisher:
+            return self._error_response(500, "Event publisher not configured")
+
+        # Parse request body
+        body = await request.read()
+        if not body:
+            return self._error_response(400, "Empty request body")
+
+        try:
+            data = _loads(body)
+        except (ValueError, UnicodeDecodeError):
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError (both ValueError subclasses)
+            return self._error_response(400, "Invalid JSON")
+
         try:
             event_type = data.get('event_type')
             event_data = data.get('data', {})
@@ -119,8 +167,7 @@ class EventAPIHandler(BaseHTTPRequestHandler):
             notify_threshold = data.get('notify_threshold')
 
             if not event_type:
-                self._send_error_response(400, "Missing 'event_type' field")
-                return
+                return self._error_response(400, "Missing 'event_type' field")
 
             # Create generic event
             try:
@@ -131,61 +178,36 @@ class EventAPIHandler(BaseHTTPRequestHandler):
                     notify_threshold=notify_threshold
                 )
             except Exception as e:
-                self._send_error_response(400, f"Error creating event: {str(e)}")
-                return
-
-            # Publish to event bus
-            # Use run_coroutine_threadsafe to schedule in the main event loop
-            if self.event_loop:
-                asyncio.run_coroutine_threadsafe(
-                    self.event_publisher(event),
-                    self.event_loop
-                )
-            else:
-                raise RuntimeError("Event loop not configured")
+                return self._error_response(400, f"Error creating event: {str(e)}")
+
+            # Publish to event bus - we are already on the bus's event loop
+            if await self.event_publisher(event) is False:
+                # Bus is saturated - ask the client to retry later
+                return self._error_response(503, "Event queue full, retry later")
 
             # Success response
-            self._send_json_response(200, {
-                "status": "success",
-                "message": f"Event '{event_type}' published successfully",
-                "event_type": event_type,
-                "will_notify": event.should_notify(),
-                "priority": event.priority.name
-            })
+            return self._bytes_response(200, _success_body(
+                event_type,
+                event.should_notify(),
+                event.priority_name
+            ))
 
         except Exception as e:
             logger.error(f"Error handling event: {e}", exc_info=True)
-            self._send_error_response(500, f"Internal error: {str(e)}")
-
-
-class EventAPIServer:
-    """HTTP server for event API."""
-
-    def __init__(self, host: str = 'localhost', port: int = 8080, event_publisher: Optional[Callable] = None):
-        """
-        Initialize API server.
-
-        Args:
-            host: Server host
-            port: Server port
-            event_publisher: Async function to publish events to event bus
-        """
-        self.host = host
-        self.port = port
-        self.server: Optional[HTTPServer] = None
-        self._running = False
-
-        # Set the event publisher and event loop on the handler class
-        EventAPIHandler.event_publisher = event_publisher
-        EventAPIHandler.event_loop = None  # Will be set in start()
+            return self._error_response(500, f"Internal error: {str(e)}")
 
     async def start(self) -> None:
         """Start the HTTP server."""
-        self.server = HTTPServer((self.host, self.port), EventAPIHandler)
-        self._running = True
+        app = web.Application()
+        app.router.add_post('/event', self._handle_event)
+        app.router.add_get('/health', self._handle_health)
+        app.router.add_get('/', self._handle_root)
+        app.router.add_route('*', '/{tail:.*}', self._handle_not_found)
 
-        # Store the event loop so HTTP handlers can schedule tasks on it
-        EventAPIHandler.event_loop = asyncio.get_running_loop()
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
 
         logger.info(f"Event API server started on http://{self.host}:{self.port}")
         print(f"✓ Event API listening on http://{self.host}:{self.port}")
@@ -193,18 +215,9 @@ class EventAPIServer:
         print(f"  GET  http://{self.host}:{self.port}/health")
         print(f"\n  All events use GenericEvent - no registration needed!\n")
 
-        # Run server in executor to avoid blocking event loop
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._serve_forever)
-
-    def _serve_forever(self) -> None:
-        """Serve requests until stopped."""
-        while self._running:
-            self.server.handle_request()
-
     async def stop(self) -> None:
         """Stop the server."""
-        self._running = False
-        if self.server:
-            self.server.server_close()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
             logger.info("Event API server stopped")
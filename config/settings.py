@@ -8,6 +8,11 @@ import logging
 from typing import Any, Dict, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to stdlib json
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +43,9 @@ class Config:
     def _load_from_file(self, config_file: str) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(config_file, 'r') as f:
-                self._config = json.load(f)
+            data = Path(config_file).read_bytes()
+            # Parse bytes directly - no separate UTF-8 decode with orjson
+            self._config = orjson.loads(data) if orjson else json.loads(data)
             logger.info(f"Loaded configuration from {config_file}")
         except Exception as e:
             logger.error(f"Error loading config file: {e}")
@@ -59,6 +65,10 @@ class Config:
         if exchange := os.getenv("EXCHANGE"):
             self._config["exchange"] = exchange
 
+        # Runtime
+        if pool_size := os.getenv("THREAD_POOL_SIZE"):
+            self._config["thread_pool_size"] = int(pool_size)
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value.
@@ -114,6 +124,11 @@ class Config:
         """Get exchange name."""
         return self.get("exchange", "binance")
 
+    @property
+    def thread_pool_size(self) -> int:
+        """Get worker count for the default thread executor."""
+        return self.get("thread_pool_size", 64)
+
 
 def setup_logging(log_level: str = "INFO") -> None:
     """
@@ -2,10 +2,11 @@
 Core event definitions and interfaces.
 Zero external dependencies.
 """
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 
@@ -17,23 +18,42 @@ class EventPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _iso_from_ms(timestamp_ms: int) -> str:
+    """Format a UTC millisecond timestamp as ISO 8601 (reused within the same ms)."""
+    seconds, millis = divmod(timestamp_ms, 1000)
+    dt = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=millis * 1000)
+    return dt.isoformat(timespec='milliseconds')
+
+
 class Event(ABC):
     """
     Base event class. All events must inherit from this.
 
     Attributes:
         event_type: Unique identifier for the event type
-        timestamp: When the event occurred
+        timestamp: When the event occurred (nanoseconds since the epoch)
         data: Event-specific payload
         priority: Event priority level
         metadata: Optional additional metadata
     """
-    event_type: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    data: Dict[str, Any] = field(default_factory=dict)
-    priority: EventPriority = EventPriority.MEDIUM
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    __slots__ = ('event_type', 'timestamp', 'data', 'priority', 'metadata', '_priority_value')
+
+    def __init__(
+        self,
+        event_type: str,
+        data: Optional[Dict[str, Any]] = None,
+        priority: EventPriority = EventPriority.MEDIUM,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[int] = None
+    ):
+        self.event_type = event_type
+        self.timestamp = timestamp if timestamp is not None else time.time_ns()
+        self.data = {} if data is None else data
+        self.priority = priority
+        self.metadata = {} if metadata is None else metadata
+        # Plain int copy of priority.value for cheap comparisons in filters
+        self._priority_value = priority.value
 
     @abstractmethod
     def should_notify(self) -> bool:
@@ -43,18 +63,23 @@ class Event(ABC):
         """
         pass
 
+    @property
+    def timestamp_iso(self) -> str:
+        """Timestamp as an ISO 8601 UTC string (millisecond precision)."""
+        return _iso_from_ms(self.timestamp // 1_000_000)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary representation."""
         return {
             "event_type": self.event_type,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "data": self.data,
             "priority": self.priority.name,
             "metadata": self.metadata
         }
 
     def __str__(self) -> str:
-        return f"{self.event_type} at {self.timestamp} - Priority: {self.priority.name}"
+        return f"{self.event_type} at {self.timestamp_iso} - Priority: {self.priority.name}"
 
 
 class EventFilter(ABC):
@@ -79,6 +104,7 @@ class PriorityFilter(EventFilter):
 
     def __init__(self, min_priority: EventPriority):
         self.min_priority = min_priority
+        self._min_value = min_priority.value
 
     def filter(self, event: Event) -> bool:
-        return event.priority.value >= self.min_priority.value
+        return event._priority_value >= self._min_value
@@ -4,8 +4,9 @@ Zero external dependencies - uses only Python standard library.
 """
 import asyncio
 import logging
-from typing import List, Optional
-from core.event import Event
+from itertools import chain
+from typing import Dict, List, Optional
+from core.event import Event, EventPriority
 from core.listener import EventListener
 
 
@@ -20,11 +21,25 @@ class EventBus:
     Listeners process events asynchronously.
     """
 
-    def __init__(self):
-        """Initialize the event bus."""
+    def __init__(self, max_batch: int = 64, max_queue: int = 4096):
+        """
+        Initialize the event bus.
+
+        Args:
+            max_batch: Max events drained from the queue per processing round
+            max_queue: Max pending events before publishers are pushed back
+        """
         self._listeners: List[EventListener] = []
-        self._event_queue: asyncio.Queue = asyncio.Queue()
+        # Routing index: listeners per event type, plus those listening to all
+        self._by_type: Dict[str, List[EventListener]] = {}
+        self._wildcard: List[EventListener] = []
+        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        # Events queued or being processed - the inline fast path waits for zero
+        self._unfinished = 0
+        # Held while inline handling or a batch runs, so the two never overlap
+        self._dispatch_lock = asyncio.Lock()
         self._running = False
+        self.max_batch = max_batch
 
     def register_listener(self, listener: EventListener) -> None:
         """
@@ -34,6 +49,11 @@ class EventBus:
             listener: EventListener instance to register
         """
         self._listeners.append(listener)
+        if listener.event_types:
+            for event_type in set(listener.event_types):
+                self._by_type.setdefault(event_type, []).append(listener)
+        else:
+            self._wildcard.append(listener)
         logger.info(f"Registered listener: {listener.get_name()}")
 
     def unregister_listener(self, listener: EventListener) -> None:
@@ -45,45 +65,118 @@ class EventBus:
         """
         if listener in self._listeners:
             self._listeners.remove(listener)
+            if listener.event_types:
+                for event_type in set(listener.event_types):
+                    routed = self._by_type.get(event_type)
+                    if routed and listener in routed:
+                        routed.remove(listener)
+                        if not routed:
+                            del self._by_type[event_type]
+            elif listener in self._wildcard:
+                self._wildcard.remove(listener)
             logger.info(f"Unregistered listener: {listener.get_name()}")
 
-    async def publish(self, event: Event) -> None:
+    async def publish(self, event: Event) -> bool:
         """
         Publish an event to the bus.
 
+        When the queue is full, HIGH and CRITICAL events wait for room;
+        lower-priority events are dropped.
+
+        With exactly one listener and nothing queued or in flight (inline
+        handling included), the event skips the queue and is handled inline,
+        so the caller awaits the handler. Inline handling and queued batches
+        never overlap, so neither overtakes the other.
+
         Args:
             event: Event to publish
+
+        Returns:
+            True if the event was queued or handled, False if it was dropped
         """
-        logger.debug(f"Publishing event: {event}")
-        await self._event_queue.put(event)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Publishing event: %s", event)
 
-    async def _process_event(self, event: Event) -> None:
+        if self._running and len(self._listeners) == 1 and self._unfinished == 0:
+            listener = self._listeners[0]
+            if listener.can_handle(event):
+                # Counted as in flight so concurrent publishers queue behind it
+                self._unfinished += 1
+                try:
+                    async with self._dispatch_lock:
+                        await listener.handle(event)
+                except Exception as e:
+                    logger.error(f"Error in listener {listener.get_name()}: {e}", exc_info=e)
+                finally:
+                    self._unfinished -= 1
+                return True
+
+        try:
+            self._event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if event.priority.value >= EventPriority.HIGH.value:
+                await self._event_queue.put(event)
+            else:
+                logger.warning("Event queue full, dropping event: %s", event.event_type)
+                return False
+        self._unfinished += 1
+        return True
+
+    async def _process_batch(self, events: List[Event]) -> None:
         """
-        Process a single event by routing to appropriate listeners.
+        Process a batch of events by routing each to appropriate listeners.
+        All listener handlers for the batch run in a single gather.
 
         Args:
-            event: Event to process
+            events: Events to process
         """
         tasks = []
-
-        for listener in self._listeners:
-            if listener.can_handle(event):
-                logger.debug(f"Routing event {event.event_type} to {listener.get_name()}")
+        targets = []
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        for event in events:
+            handled = False
+            # Only consider listeners subscribed to this type (or to all types)
+            typed = self._by_type.get(event.event_type, ())
+            for listener in chain(typed, self._wildcard):
+                # A failing filter only costs this listener this event
+                try:
+                    if not listener.can_handle(event):
+                        continue
+                except Exception as e:
+                    logger.error(f"Error routing event {event.event_type} to {listener.get_name()}: {e}", exc_info=e)
+                    continue
+                if debug:
+                    logger.debug("Routing event %s to %s", event.event_type, listener.get_name())
                 tasks.append(listener.handle(event))
+                targets.append(listener)
+                handled = True
 
-        if tasks:
-            # Run all listener handlers concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Log any exceptions that occurred
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(
-                        f"Error in listener {self._listeners[i].get_name()}: {result}",
-                        exc_info=result
-                    )
-        else:
-            logger.warning(f"No listeners handled event: {event.event_type}")
+            if not handled:
+                logger.warning("No listeners handled event: %s", event.event_type)
+
+        if not tasks:
+            return
+
+        # Run all listener handlers concurrently
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Log any exceptions that occurred
+        for listener, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Error in listener {listener.get_name()}: {result}",
+                    exc_info=result
+                )
+
+    async def _process_event(self, event: Event) -> None:
+        """
+        Process a single event by routing to appropriate listeners.
+
+        Args:
+            event: Event to process
+        """
+        await self._process_batch([event])
 
     async def start(self) -> None:
         """
@@ -97,24 +190,38 @@ class EventBus:
             try:
                 # Wait for events with timeout to allow graceful shutdown
                 event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-                await self._process_event(event)
-                self._event_queue.task_done()
             except asyncio.TimeoutError:
                 # No events received, continue loop
                 continue
+
+            # Drain whatever else is already queued so bursts share one gather
+            batch = [event]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._event_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                async with self._dispatch_lock:
+                    await self._process_batch(batch)
             except Exception as e:
                 logger.error(f"Error processing event: {e}", exc_info=True)
+            finally:
+                self._unfinished -= len(batch)
+                for _ in batch:
+                    self._event_queue.task_done()
 
         logger.info("Event bus stopped")
 
     async def stop(self) -> None:
         """Stop the event bus gracefully."""
-        self._running = False
-
-        # Wait for remaining events to be processed
+        # Wait for remaining events to be processed while the loop still runs
         await self._event_queue.join()
         logger.info("All pending events processed")
 
+        self._running = False
+
     def get_listener_count(self) -> int:
         """Get the number of registered listeners."""
         return len(self._listeners)
@@ -2,9 +2,110 @@
 Generic event implementation.
 All events use the same class - configured via JSON.
 """
+import operator
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
 from core.event import Event, EventPriority
 
 
+# Priority name -> enum, keyed by interned upper-case names
+_PRIORITY_MAP = {sys.intern(p.name): p for p in EventPriority}
+
+# Formatting characters stripped from string values before numeric comparison
+_CLEAN_TABLE = str.maketrans('', '', '$,%+')
+
+# Threshold operators, in the order they take precedence
+_OPERATORS = (
+    ("gt", operator.gt),                          # Greater than
+    ("gte", operator.ge),                         # Greater than or equal
+    ("lt", operator.lt),                          # Less than
+    ("lte", operator.le),                         # Less than or equal
+    ("abs_gte", lambda v, b: abs(v) >= b),        # Absolute value greater than or equal
+    ("abs_gt", lambda v, b: abs(v) > b),          # Absolute value greater than
+)
+
+
+def _always(data: Dict[str, Any]) -> bool:
+    return True
+
+
+def _never(data: Dict[str, Any]) -> bool:
+    return False
+
+
+def _compile_threshold(threshold: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a notification predicate for a threshold dict.
+
+    Args:
+        threshold: Notification rules (see GenericEvent)
+
+    Returns:
+        Function taking the event data and returning True if it should notify
+    """
+    # Always notify
+    if threshold.get("always"):
+        return _always
+
+    # Never notify
+    if threshold.get("never"):
+        return _never
+
+    # Default: notify
+    if "field" not in threshold:
+        return _always
+
+    # Field-based rules
+    field = threshold["field"]
+    compare = None
+    bound = None
+    for name, op in _OPERATORS:
+        if name in threshold:
+            compare, bound = op, threshold[name]
+            break
+
+    def field_rule(data: Dict[str, Any]) -> bool:
+        if field not in data:
+            return False
+
+        value = data[field]
+
+        # Try to convert to number for comparisons
+        try:
+            # Remove common formatting characters
+            if isinstance(value, str):
+                value = value.translate(_CLEAN_TABLE)
+            value = float(value)
+        except (ValueError, TypeError):
+            return False
+
+        if compare is None:
+            return True
+        return compare(value, bound)
+
+    return field_rule
+
+
+@lru_cache(maxsize=256)
+def _compile_threshold_cached(rule: frozenset) -> Callable[[Dict[str, Any]], bool]:
+    return _compile_threshold(dict(rule))
+
+
+def _threshold_predicate(threshold: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Get the notification predicate for a threshold dict.
+    Producers usually resend the same few rules, so predicates are shared
+    across events with identical thresholds.
+    """
+    try:
+        return _compile_threshold_cached(frozenset(threshold.items()))
+    except TypeError:
+        # Unhashable rule values - compile without caching
+        return _compile_threshold(threshold)
+
+
 class GenericEvent(Event):
     """
     Universal event class.
@@ -21,6 +122,8 @@ class GenericEvent(Event):
         )
     """
 
+    __slots__ = ('notify_threshold', '_notify_fn', '_notify_cached', 'priority_name')
+
     def __init__(
         self,
         event_type: str,
@@ -42,74 +145,31 @@ class GenericEvent(Event):
                 - {"field": "value", "gt": 100} - notify if data["value"] > 100
                 - {"field": "change_percent", "abs_gte": 2.0} - notify if abs(data["change_percent"]) >= 2.0
         """
-        # Parse priority string to enum
-        try:
-            priority_enum = EventPriority[priority.upper()]
-        except (KeyError, AttributeError):
-            priority_enum = EventPriority.MEDIUM
+        # Parse priority string to enum (unknown or non-string -> MEDIUM)
+        priority_enum = _PRIORITY_MAP.get(
+            priority.upper() if isinstance(priority, str) else '',
+            EventPriority.MEDIUM
+        )
 
         super().__init__(
             event_type=event_type,
             data=data,
             priority=priority_enum
         )
+        # Priority name as a plain str (used on the API response path)
+        self.priority_name = priority_enum.name
 
         self.notify_threshold = notify_threshold or {"always": True}
+        # Threshold is fixed for the event's lifetime - interpret it once
+        self._notify_fn = _threshold_predicate(self.notify_threshold)
+        self._notify_cached: Optional[bool] = None
 
     def should_notify(self) -> bool:
         """
         Determine if notification should be sent based on threshold rules.
+        Evaluated once; every listener sees the same answer.
         """
-        threshold = self.notify_threshold
-
-        # Always notify
-        if threshold.get("always"):
-            return True
-
-        # Never notify
-        if threshold.get("never"):
-            return False
-
-        # Field-based rules
-        if "field" in threshold:
-            field = threshold["field"]
-            if field not in self.data:
-                return False
-
-            value = self.data[field]
-
-            # Try to convert to number for comparisons
-            try:
-                # Remove common formatting characters
-                if isinstance(value, str):
-                    value = value.replace("$", "").replace(",", "").replace("%", "").replace("+", "")
-                value = float(value)
-            except (ValueError, TypeError):
-                return False
-
-            # Greater than
-            if "gt" in threshold:
-                return value > threshold["gt"]
-
-            # Greater than or equal
-            if "gte" in threshold:
-                return value >= threshold["gte"]
-
-            # Less than
-            if "lt" in threshold:
-                return value < threshold["lt"]
-
-            # Less than or equal
-            if "lte" in threshold:
-                return value <= threshold["lte"]
-
-            # Absolute value greater than or equal
-            if "abs_gte" in threshold:
-                return abs(value) >= threshold["abs_gte"]
-
-            # Absolute value greater than
-            if "abs_gt" in threshold:
-                return abs(value) > threshold["abs_gt"]
-
-        # Default: notify
-        return True
+        result = self._notify_cached
+        if result is None:
+            result = self._notify_cached = self._notify_fn(self.data)
+        return result
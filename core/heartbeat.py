@@ -4,8 +4,9 @@ Pings external monitoring service periodically.
 """
 import asyncio
 import logging
-from urllib.request import urlopen
-from urllib.error import URLError, HTTPError
+from typing import Optional
+
+import aiohttp
 
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,7 @@ class HeartbeatMonitor:
         self.ping_url = ping_url
         self.interval_seconds = interval_seconds
         self._running = False
+        self._session: Optional[aiohttp.ClientSession] = None
 
     async def start(self) -> None:
         """
@@ -34,15 +36,13 @@ class HeartbeatMonitor:
         Runs continuously sending pings at configured interval.
         """
         self._running = True
+        # One session for the monitor's lifetime so pings reuse the connection
+        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
         logger.info(f"Heartbeat monitor started (pinging every {self.interval_seconds}s)")
 
         while self._running:
             try:
-                # Send ping in executor to avoid blocking
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self._send_ping
-                )
+                await self._send_ping()
                 logger.debug(f"Heartbeat ping sent successfully")
 
             except Exception as e:
@@ -53,21 +53,27 @@ class HeartbeatMonitor:
 
         logger.info("Heartbeat monitor stopped")
 
-    def _send_ping(self) -> None:
+    async def _send_ping(self) -> None:
         """
-        Send HTTP GET request to ping URL (blocking, runs in executor).
+        Send HTTP GET request to ping URL.
 
         Raises:
             Exception: If ping fails
         """
         try:
-            with urlopen(self.ping_url, timeout=10) as response:
-                response.read()
-        except HTTPError as e:
-            raise Exception(f"HTTP error: {e.code}")
-        except URLError as e:
-            raise Exception(f"Network error: {e.reason}")
+            async with self._session.get(self.ping_url) as response:
+                await response.read()
+        except asyncio.TimeoutError:
+            raise Exception("Network error: timed out")
+        except aiohttp.ClientError as e:
+            raise Exception(f"Network error: {e}")
+
+        if response.status >= 400:
+            raise Exception(f"HTTP error: {response.status}")
 
     async def stop(self) -> None:
         """Stop the heartbeat monitor."""
         self._running = False
+        if self._session:
+            await self._session.close()
+            self._session = None
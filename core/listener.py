@@ -25,6 +25,8 @@ class EventListener(ABC):
         """
         self.event_types = event_types or []
         self.filters = filters or []
+        # Hashed copy for O(1) membership checks (None means all events)
+        self._event_types_set = frozenset(event_types) if event_types else None
 
     def can_handle(self, event: Event) -> bool:
         """
@@ -37,7 +39,7 @@ class EventListener(ABC):
             True if listener should handle this event
         """
         # Check if we listen to this event type (empty list means all events)
-        if self.event_types and event.event_type not in self.event_types:
+        if self._event_types_set is not None and event.event_type not in self._event_types_set:
             return False
 
         # Apply all filters
@@ -6,6 +6,9 @@ All events now use GenericEvent - no custom classes needed!
 """
 import asyncio
 import signal
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from core.event import Event
 from core.event_bus import EventBus
@@ -15,6 +18,11 @@ from notifications.discord_handler import DiscordWebhookHandler
 from config.settings import Config, setup_logging
 from api.http_api import EventAPIServer
 
+try:
+    import uvloop
+except ImportError:  # Optional speedup - fall back to the default asyncio loop
+    uvloop = None
+
 
 # ============================================================================
 # No event class definitions needed! All events use GenericEvent now.
@@ -22,20 +30,49 @@ from api.http_api import EventAPIServer
 # ============================================================================
 
 
+_SEP60 = "=" * 60
+
+
 # Console listener for testing
 class ConsoleListener(EventListener):
     """Simple console output listener for testing."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Writes to a pipe/file can stall, so those go through a thread -
+        # a single one, so events are printed in the order they were handled
+        self._writer = None
+        if not sys.stdout.isatty():
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="console")
+        # Last formatted second - bursts mostly share it
+        self._last_sec = -1
+        self._last_sec_str = ""
+
     def get_name(self) -> str:
         return "ConsoleListener"
 
+    def _format_time(self, timestamp_ns: int) -> str:
+        """Format an event timestamp (UTC, second resolution), reusing the last result."""
+        sec = timestamp_ns // 1_000_000_000
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_sec_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(sec))
+        return self._last_sec_str
+
     async def handle(self, event: Event) -> None:
-        print(f"\n{'='*60}")
-        print(f"[{event.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {event.event_type.upper()}")
-        print(f"Priority: {event.priority.name}")
-        print(f"Data: {event.data}")
-        print(f"Should Notify: {event.should_notify()}")
-        print(f"{'='*60}\n")
+        # One write per event instead of one per line
+        text = (
+            f"\n{_SEP60}\n"
+            f"[{self._format_time(event.timestamp)}] {event.event_type.upper()}\n"
+            f"Priority: {event.priority.name}\n"
+            f"Data: {event.data}\n"
+            f"Should Notify: {event.should_notify()}\n"
+            f"{_SEP60}\n\n"
+        )
+        if self._writer is not None:
+            await asyncio.get_running_loop().run_in_executor(self._writer, sys.stdout.write, text)
+        else:
+            sys.stdout.write(text)
 
 
 async def main():
@@ -44,6 +81,13 @@ async def main():
     config = Config(config_file="config.json")  # Falls back to env vars if file missing
     setup_logging(config.log_level)
 
+    # Size the default executor for blocking I/O before anything uses it
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(
+        max_workers=config.thread_pool_size,
+        thread_name_prefix="evt-io"
+    ))
+
     # Create event bus
     event_bus = EventBus()
 
@@ -53,6 +97,7 @@ async def main():
     event_bus.register_listener(console_listener)
 
     # Discord listener (only if webhook configured)
+    discord_listener = None
     try:
         discord_webhook = config.discord_webhook_url
         discord_listener = DiscordWebhookHandler(
@@ -84,23 +129,25 @@ async def main():
     heartbeat = HeartbeatMonitor(heartbeat_url, heartbeat_interval)
     heartbeat_task = asyncio.create_task(heartbeat.start())
 
-    print(f"\n{'='*60}")
+    print(f"\n{_SEP60}")
     print("Crypto Alert System - Service Mode")
-    print(f"{'='*60}")
+    print(_SEP60)
     print(f"Active listeners: {event_bus.get_listener_count()}")
     print(f"Heartbeat: Pinging every {heartbeat_interval}s")
     print(f"\nService running... Press Ctrl+C to stop")
-    print(f"{'='*60}\n")
+    print(f"{_SEP60}\n")
 
     # Setup graceful shutdown
     shutdown_event = asyncio.Event()
 
     def signal_handler():
-        print("\n\nShutdown signal received...")
+        print("\n\nShutdown signal received... (send again to force exit)")
+        # Restore default handling so a second signal aborts the flush
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(sig)
         shutdown_event.set()
 
     # Register signal handlers
-    loop = asyncio.get_event_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
         loop.add_signal_handler(sig, signal_handler)
 
@@ -109,25 +156,37 @@ async def main():
 
     # Graceful shutdown
     print("Stopping services...")
-    await heartbeat.stop()
+
+    # Stop intake first, then drain the bus, then flush batched webhooks
     await api_server.stop()
     await event_bus.stop()
+    if discord_listener:
+        await discord_listener.close()
+    await heartbeat.stop()
 
-    # Cancel tasks
-    heartbeat_task.cancel()
-    api_task.cancel()
-    bus_task.cancel()
-
-    try:
-        await asyncio.gather(heartbeat_task, api_task, bus_task, return_exceptions=True)
-    except asyncio.CancelledError:
-        pass
+    # Background loops have nothing left to do - cancel and reap them
+    for task in (heartbeat_task, api_task, bus_task):
+        task.cancel()
+    await asyncio.gather(heartbeat_task, api_task, bus_task, return_exceptions=True)
 
     print("✓ Service stopped successfully")
 
 
+def run() -> None:
+    """Run the service, on uvloop when it is installed."""
+    if sys.version_info >= (3, 11):
+        loop_factory = uvloop.new_event_loop if uvloop else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
+    else:
+        # asyncio.Runner is 3.11+; older Pythons select the loop via the policy
+        if uvloop:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main())
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run()
     except KeyboardInterrupt:
         print("\n✓ Service stopped")
@@ -3,24 +3,93 @@ Discord notification handler.
 Uses webhook for minimal dependencies (no discord.py needed).
 """
 import asyncio
-import logging
 import json
-import requests
+import logging
+import random
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional
-from urllib.error import HTTPError, URLError
+
+import aiohttp
 
 from core.event import Event, EventPriority
 from core.listener import EventListener
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to stdlib json
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Max recently-sent event keys remembered for de-duplication
+MAX_RECENT_EVENTS = 1024
+
+# Discord accepts at most 10 embeds per webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+
+# Embed colors indexed by EventPriority.value - 1: LOW, MEDIUM, HIGH, CRITICAL
+_COLORS = (
+    0x808080,  # Gray
+    0x3498db,  # Blue
+    0xf39c12,  # Orange
+    0xe74c3c,  # Red
+)
+
+# Priority embed field per level - identical for every event, so built once
+_PRIORITY_FIELDS = {
+    priority: {"name": "Priority", "value": priority.name, "inline": True}
+    for priority in EventPriority
+}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Retry backoff: base * 2**attempt seconds, capped, plus up to 50% jitter
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+BACKOFF_JITTER = 0.5
+
+# Statuses meaning the payload itself was refused (bad embed / too large);
+# other 4xx (401, 403, 404...) mean the webhook is unusable
+_PAYLOAD_REJECTED = frozenset((400, 413))
+
+
+@lru_cache(maxsize=256)
+def _pretty(key: str) -> str:
+    """Turn a data key like "change_pct" into a field name like "Change Pct"."""
+    return key.replace("_", " ").title()
+
+
+def _dumps(payload) -> bytes:
+    """Serialize a webhook payload (or part of one) to JSON bytes."""
+    if orjson:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _next_delay(attempt: int, server_hint: Optional[float] = None) -> float:
+    """
+    Compute the delay before the next retry.
+
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        server_hint: Server-requested delay (Retry-After), used as a floor
+
+    Returns:
+        Seconds to wait
+    """
+    delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * (1 + random.random() * BACKOFF_JITTER)
+    return max(server_hint or 0.0, delay)
+
 
 class DiscordWebhookHandler(EventListener):
     """
     Discord notification handler using webhooks.
 
-    No external dependencies - uses only standard library urllib.
+    Sends through one long-lived aiohttp session so connections are reused.
+    Embeds arriving within a short window are batched into one message.
     Webhooks are simpler than bots for send-only notifications.
     """
 
@@ -30,7 +99,12 @@ class DiscordWebhookHandler(EventListener):
         event_types: Optional[list] = None,
         filters: Optional[list] = None,
         username: str = "Trade Alert Bot",
-        max_retries: int = 3
+        max_retries: int = 3,
+        batch_window: float = 0.5,
+        max_pending: int = 1000,
+        rate_limit: int = 5,
+        rate_window: float = 2.0,
+        dedupe_ttl: float = 0.0
     ):
         """
         Initialize Discord webhook handler.
@@ -41,11 +115,34 @@ class DiscordWebhookHandler(EventListener):
             filters: Event filters to apply
             username: Bot username for messages
             max_retries: Max retry attempts for failed sends
+            batch_window: Seconds to wait for more embeds before sending a batch
+            max_pending: Max embeds waiting to be sent before handle() blocks
+            rate_limit: Max webhook requests per rate_window
+            rate_window: Rate limit window in seconds
+            dedupe_ttl: Seconds during which an identical event (same type,
+                priority and data) is not re-sent. Defaults to 0 (disabled);
+                set it to about batch_window to collapse bursts of repeats
         """
         super().__init__(event_types=event_types, filters=filters)
         self.webhook_url = webhook_url
         self.username = username
         self.max_retries = max_retries
+        self.batch_window = batch_window
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (dedupe key, serialized embed) pairs waiting to be coalesced into one webhook message
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._flusher: Optional[asyncio.Task] = None
+        # Client-side fixed-window limiter; the effective limit shrinks on
+        # 429s and creeps back up on successes (AIMD)
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self._window_limit = float(rate_limit)
+        self._window_start = 0.0
+        self._window_count = 0
+        self._rate_lock = asyncio.Lock()
+        # Recently sent event keys -> send time, oldest first
+        self.dedupe_ttl = dedupe_ttl
+        self._recent: OrderedDict = OrderedDict()
 
     def get_name(self) -> str:
         """Return listener name."""
@@ -53,115 +150,256 @@ class DiscordWebhookHandler(EventListener):
 
     def _format_message(self, event: Event) -> dict:
         """
-        Format event into Discord embed message.
+        Format event into a Discord embed.
 
         Args:
             event: Event to format
 
         Returns:
-            Discord webhook payload
-        """
-        # Color coding based on priority
-        color_map = {
-            EventPriority.LOW: 0x808080,      # Gray
-            EventPriority.MEDIUM: 0x3498db,   # Blue
-            EventPriority.HIGH: 0xf39c12,     # Orange
-            EventPriority.CRITICAL: 0xe74c3c  # Red
-        }
+            Discord embed dict
+        """
+        # Data fields, then the (shared, read-only) priority field
+        fields = [
+            {"name": _pretty(key), "value": str(value), "inline": True}
+            for key, value in event.data.items()
+        ]
+        fields.append(_PRIORITY_FIELDS[event.priority])
 
-        embed = {
+        return {
             "title": f"🔔 {event.event_type}",
-            "color": color_map.get(event.priority, 0x3498db),
-            "timestamp": event.timestamp.isoformat(),
-            "fields": []
+            "color": _COLORS[event.priority.value - 1],
+            "timestamp": event.timestamp_iso,
+            "fields": fields
         }
 
-        # Add data fields
-        for key, value in event.data.items():
-            embed["fields"].append({
-                "name": key.replace("_", " ").title(),
-                "value": str(value),
-                "inline": True
-            })
-
-        # Add priority
-        embed["fields"].append({
-            "name": "Priority",
-            "value": event.priority.name,
-            "inline": True
-        })
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def _acquire_send_slot(self) -> None:
+        """Wait until the rate limiter admits another request."""
+        loop = asyncio.get_running_loop()
+
+        async with self._rate_lock:
+            while True:
+                now = loop.time()
+                if now - self._window_start >= self.rate_window:
+                    self._window_start = now
+                    self._window_count = 0
+
+                if self._window_count < int(self._window_limit):
+                    self._window_count += 1
+                    return
+
+                await asyncio.sleep(self.rate_window - (now - self._window_start))
+
+    def _on_rate_limited(self) -> None:
+        """Halve the admitted requests per window after a 429."""
+        self._window_limit = max(1.0, self._window_limit / 2)
+
+    def _on_sent(self) -> None:
+        """Grow the admitted requests per window back towards rate_limit."""
+        self._window_limit = min(float(self.rate_limit), self._window_limit + 1 / self._window_limit)
+
+    def _build_body(self, embeds: list) -> bytes:
+        """
+        Assemble a webhook payload from already-serialized embeds.
 
-        return {
-            "username": self.username,
-            "embeds": [embed]
-        }
+        Args:
+            embeds: JSON-encoded embeds
+
+        Returns:
+            JSON-encoded Discord webhook payload
+        """
+        return b"".join((
+            b'{"username":', _dumps(self.username), b',"embeds":[',
+            b",".join(embeds),
+            b"]}"
+        ))
 
-    async def _send_webhook(self, payload: dict) -> bool:
+    async def _send_webhook(self, body: bytes) -> Optional[bool]:
         """
         Send webhook message with retries.
 
         Args:
-            payload: Discord webhook payload
+            body: JSON-encoded Discord webhook payload (reused across retries)
 
         Returns:
-            True if successful, False otherwise
+            True if successful, None if Discord rejected the payload
+            (400/413), False otherwise
         """
+        session = self._get_session()
+
         for attempt in range(self.max_retries):
+            server_hint = None
+            await self._acquire_send_slot()
             try:
-                # Run blocking HTTP request in executor to avoid blocking event loop
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self._send_request,
-                    payload
-                )
-                logger.info("Discord notification sent successfully")
-                return True
-
-            except HTTPError as e:
-                if e.code == 429:  # Rate limited
-                    retry_after = int(e.headers.get("Retry-After", 1))
-                    logger.warning(f"Rate limited, retrying after {retry_after}s")
-                    await asyncio.sleep(retry_after)
+                async with session.post(self.webhook_url, data=body, headers=_JSON_HEADERS) as response:
+                    status = response.status
+                    reason = response.reason
+                    retry_after = response.headers.get("Retry-After")
+
+                if status < 400:
+                    self._on_sent()
+                    logger.info("Discord notification sent successfully")
+                    return True
+
+                if status == 429:  # Rate limited
+                    self._on_rate_limited()
+                    server_hint = float(retry_after or 1)
+                    logger.warning(f"Rate limited (Retry-After {server_hint}s)")
+                elif status >= 500:
+                    logger.error(f"Server error sending Discord notification: {status} - {reason}")
                 else:
-                    logger.error(f"HTTP error sending Discord notification: {e.code} - {e.reason}")
-                    if attempt == self.max_retries - 1:
-                        return False
+                    # Other 4xx won't succeed on retry
+                    logger.error(f"HTTP error sending Discord notification: {status} - {reason}")
+                    return None if status in _PAYLOAD_REJECTED else False
 
-            except URLError as e:
-                logger.error(f"Network error sending Discord notification: {e.reason}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Network error sending Discord notification: {e!r}")
 
             except Exception as e:
                 logger.error(f"Unexpected error sending Discord notification: {e}", exc_info=True)
                 return False
 
+            if attempt < self.max_retries - 1:
+                delay = _next_delay(attempt, server_hint)
+                logger.warning(f"Retrying Discord notification in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+        logger.error(f"Giving up on Discord notification after {self.max_retries} attempts")
         return False
 
-    def _send_request(self, payload: dict) -> None:
+    async def _send_batch(self, batch: list) -> None:
         """
-        Send HTTP request (blocking, should be called in executor).
+        Send queued (dedupe key, embed) pairs as one webhook message.
+
+        Discord rejects a whole message if any embed is invalid or the
+        embeds together exceed its size limit, so a rejected batch is
+        re-sent one embed at a time rather than dropped.
 
         Args:
-            payload: Discord webhook payload
+            batch: Queued (dedupe key, serialized embed) pairs
         """
+        sent = await self._send_webhook(self._build_body([embed for _, embed in batch]))
+        if sent is None and len(batch) > 1:
+            logger.warning("Discord rejected a batch of %d embeds, re-sending individually", len(batch))
+            for item in batch:
+                await self._send_batch([item])
+            return
+
+        if not sent:
+            # Let a resend of a failed alert through
+            self._forget(key for key, _ in batch)
+
+    async def _flush_loop(self) -> None:
+        """
+        Coalesce queued embeds and send them as batched webhook messages.
+        A batch goes out when it is full or batch_window has elapsed.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+
+            while len(batch) < MAX_EMBEDS_PER_MESSAGE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._send_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
 
-        data = json.dumps(payload).encode("utf-8")
+    async def close(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        Send any queued embeds, then close the HTTP session.
+
+        Args:
+            timeout: Max seconds to spend flushing (None waits indefinitely);
+                embeds still queued after that are dropped
+        """
+        if self._flusher is not None:
+            if not self._flusher.done():
+                try:
+                    await asyncio.wait_for(self._queue.join(), timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Discord flush timed out after %ss, dropping %d queued notifications",
+                        timeout, self._queue.qsize()
+                    )
+                self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _dedupe_key(self, event: Event) -> Optional[tuple]:
+        """
+        Build the de-duplication key for an event.
 
-        request = requests.Request(
-            url=self.webhook_url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST"
+        Args:
+            event: Event to key
+
+        Returns:
+            Key tuple, or None if de-duplication is disabled
+        """
+        if self.dedupe_ttl <= 0:
+            return None
+        return (
+            event.event_type,
+            event.priority,
+            frozenset((k, str(v)) for k, v in event.data.items())
         )
 
-        prepared = request.prepare()
+    def _is_duplicate(self, key: Optional[tuple]) -> bool:
+        """
+        Check whether an identical event was sent within dedupe_ttl,
+        recording this one if not.
+
+        Args:
+            key: Key from _dedupe_key
+
+        Returns:
+            True if the event should be dropped as a duplicate
+        """
+        if key is None:
+            return False
+
+        now = time.monotonic()
+
+        sent_at = self._recent.get(key)
+        if sent_at is not None and now - sent_at < self.dedupe_ttl:
+            return True
 
-        # with urlopen(request, timeout=10) as response:
-        #     response.read()
-        session = requests.Session()
-        response = session.send(prepared, timeout=10)
-        print("Status:", response.status_code)
+        self._recent[key] = now
+        self._recent.move_to_end(key)
+        while len(self._recent) > MAX_RECENT_EVENTS:
+            self._recent.popitem(last=False)
+        return False
+
+    def _forget(self, keys) -> None:
+        """Drop recorded keys of events whose send failed."""
+        for key in keys:
+            if key is not None:
+                self._recent.pop(key, None)
 
     async def handle(self, event: Event) -> None:
         """
@@ -171,9 +409,18 @@ class DiscordWebhookHandler(EventListener):
             event: Event to handle
         """
         if not event.should_notify():
-            logger.debug(f"Event {event.event_type} should not notify, skipping")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Event %s should not notify, skipping", event.event_type)
+            return
+
+        key = self._dedupe_key(event)
+        if self._is_duplicate(key):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Event %s duplicates a recent notification, skipping", event.event_type)
             return
 
-        logger.info(f"Handling event: {event.event_type}")
-        payload = self._format_message(event)
-        await self._send_webhook(payload)
+        logger.info("Handling event: %s", event.event_type)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        # Serialize on enqueue so batches are assembled by byte concatenation
+        await self._queue.put((key, _dumps(self._format_message(event))))
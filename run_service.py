@@ -5,12 +5,15 @@ Starts the alert system with proper configuration and logging.
 """
 import sys
 import os
-import asyncio
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from main import main
+from main import run
+
+# Checked once at import; only used for the startup hint below
+CONFIG_FILE = "config.json"
+_CONFIG_EXISTS = os.path.exists(CONFIG_FILE)
 
 
 def check_environment():
@@ -18,10 +21,7 @@ def check_environment():
     issues = []
 
     # Check if Discord webhook is configured
-    webhook = os.getenv("DISCORD_WEBHOOK_URL")
-    config_file = "config.json"
-
-    if not webhook and not os.path.exists(config_file):
+    if not (_CONFIG_EXISTS or os.getenv("DISCORD_WEBHOOK_URL")):
         issues.append("⚠ Discord webhook not configured")
         issues.append("  Set DISCORD_WEBHOOK_URL env var or create config.json")
 
@@ -52,7 +52,7 @@ if __name__ == "__main__":
     # Start service
     try:
         print("Starting service...\n")
-        asyncio.run(main())
+        run()
     except KeyboardInterrupt:
         print("\n\n✓ Service stopped gracefully")
     except Exception as e:
@@ -1,18 +1,29 @@
 #!/usr/bin/env python3
 """
 Test event publisher - sends test events to running service.
-Uses only standard library (no external dependencies).
+Uses aiohttp with one pooled session, so all events share a connection.
 
 UPDATED: Uses GenericEvent - send any event with simple JSON!
 """
+import asyncio
 import json
 import sys
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+from typing import Optional
+
+import aiohttp
+
+_SEP70 = "=" * 70
 
 
 class EventPublisher:
-    """Simple HTTP client to publish events to the API."""
+    """
+    Simple HTTP client to publish events to the API.
+
+    Use as an async context manager so the HTTP session is closed:
+
+        async with EventPublisher() as publisher:
+            await publisher.publish_event("price_alert", {...})
+    """
 
     def __init__(self, base_url: str = "http://localhost:8080"):
         """
@@ -22,8 +33,24 @@ class EventPublisher:
             base_url: Base URL of the API server
         """
         self.base_url = base_url.rstrip('/')
+        self._session: Optional[aiohttp.ClientSession] = None
 
-    def publish_event(
+    async def __aenter__(self) -> "EventPublisher":
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def publish_event(
         self,
         event_type: str,
         data: dict,
@@ -56,42 +83,38 @@ class EventPublisher:
         if notify_threshold:
             payload["notify_threshold"] = notify_threshold
 
-        url = f"{self.base_url}/event"
-        json_data = json.dumps(payload).encode('utf-8')
-
-        request = Request(
-            url,
-            data=json_data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
-
         try:
-            with urlopen(request, timeout=10) as response:
-                response_data = json.loads(response.read().decode('utf-8'))
-                return response_data
-        except HTTPError as e:
-            error_body = e.read().decode('utf-8')
-            try:
-                error_data = json.loads(error_body)
-                raise Exception(f"HTTP {e.code}: {error_data.get('error', 'Unknown error')}")
-            except json.JSONDecodeError:
-                raise Exception(f"HTTP {e.code}: {error_body}")
-        except URLError as e:
-            raise Exception(f"Network error: {e.reason}")
-
-    def health_check(self) -> dict:
+            async with self._session.post(
+                f"{self.base_url}/event",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                body = await response.text()
+                if response.status >= 400:
+                    try:
+                        error_data = json.loads(body)
+                        raise Exception(f"HTTP {response.status}: {error_data.get('error', 'Unknown error')}")
+                    except json.JSONDecodeError:
+                        raise Exception(f"HTTP {response.status}: {body}")
+                return json.loads(body)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Network error: {e}")
+
+    async def health_check(self) -> dict:
         """
         Check if API is healthy.
 
         Returns:
             Health status
         """
-        request = Request(f"{self.base_url}/health")
         try:
-            with urlopen(request, timeout=5) as response:
-                return json.loads(response.read().decode('utf-8'))
-        except (HTTPError, URLError) as e:
+            async with self._session.get(
+                f"{self.base_url}/health",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                response.raise_for_status()
+                return await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise Exception(f"Health check failed: {e}")
 
 
@@ -105,36 +128,11 @@ def print_response(response: dict, success: bool = True):
     print(f"   Will notify: {will_notify}, Priority: {priority}")
 
 
-def run_tests(api_url: str = "http://localhost:8080"):
-    """
-    Run test event publishing.
-
-    Args:
-        api_url: API base URL
-    """
-    publisher = EventPublisher(api_url)
-
-    print(f"{'='*70}")
-    print("Event Publisher - Test Suite (GenericEvent)")
-    print(f"{'='*70}")
-    print(f"Target: {api_url}\n")
-
-    # Health check
-    try:
-        health = publisher.health_check()
-        print(f"✓ Service is healthy: {health.get('status')}\n")
-    except Exception as e:
-        print(f"✗ Service unreachable: {e}")
-        print("\nMake sure the service is running:")
-        print("  python main.py")
-        sys.exit(1)
-
-    print("Sending test events...\n")
-
-    # Test 1: Price alert with threshold
-    try:
-        print("1. Price Alert - BTC +5.3% (HIGH priority, with threshold)")
-        response = publisher.publish_event(
+# Test events: (description, publish_event kwargs)
+TEST_EVENTS = [
+    (
+        "Price Alert - BTC +5.3% (HIGH priority, with threshold)",
+        dict(
             event_type="price_alert",
             data={
                 "symbol": "BTC/USDT",
@@ -144,14 +142,10 @@ def run_tests(api_url: str = "http://localhost:8080"):
             priority="HIGH",
             notify_threshold={"field": "change", "abs_gte": 2.0}
         )
-        print_response(response)
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-
-    # Test 2: Price alert - will notify
-    try:
-        print("\n2. Price Alert - ETH -3.2% (MEDIUM priority)")
-        response = publisher.publish_event(
+    ),
+    (
+        "Price Alert - ETH -3.2% (MEDIUM priority)",
+        dict(
             event_type="price_alert",
             data={
                 "symbol": "ETH/USDT",
@@ -161,14 +155,10 @@ def run_tests(api_url: str = "http://localhost:8080"):
             priority="MEDIUM",
             notify_threshold={"field": "change", "abs_gte": 2.0}
         )
-        print_response(response)
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-
-    # Test 3: Small change - won't notify
-    try:
-        print("\n3. Price Alert - BNB +0.8% (won't notify, below threshold)")
-        response = publisher.publish_event(
+    ),
+    (
+        "Price Alert - BNB +0.8% (won't notify, below threshold)",
+        dict(
             event_type="price_alert",
             data={
                 "symbol": "BNB/USDT",
@@ -178,14 +168,10 @@ def run_tests(api_url: str = "http://localhost:8080"):
             priority="LOW",
             notify_threshold={"field": "change", "abs_gte": 2.0}
         )
-        print_response(response)
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-
-    # Test 4: Volume spike
-    try:
-        print("\n4. Volume Spike - SOL 3.5x average (HIGH priority)")
-        response = publisher.publish_event(
+    ),
+    (
+        "Volume Spike - SOL 3.5x average (HIGH priority)",
+        dict(
             event_type="volume_spike",
             data={
                 "symbol": "SOL/USDT",
@@ -196,14 +182,10 @@ def run_tests(api_url: str = "http://localhost:8080"):
             priority="HIGH",
             notify_threshold={"field": "spike_ratio", "gte": 2.0}
         )
-        print_response(response)
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-
-    # Test 5: RSI Alert
-    try:
-        print("\n5. RSI Alert - BTC RSI 75 (overbought)")
-        response = publisher.publish_event(
+    ),
+    (
+        "RSI Alert - BTC RSI 75 (overbought)",
+        dict(
             event_type="rsi_alert",
             data={
                 "symbol": "BTC/USDT",
@@ -213,14 +195,10 @@ def run_tests(api_url: str = "http://localhost:8080"):
             priority="HIGH",
             notify_threshold={"always": True}
         )
-        print_response(response)
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-
-    # Test 6: Whale transaction
-    try:
-        print("\n6. Whale Transaction - $5M BTC buy (CRITICAL)")
-        response = publisher.publish_event(
+    ),
+    (
+        "Whale Transaction - $5M BTC buy (CRITICAL)",
+        dict(
             event_type="whale_transaction",
             data={
                 "symbol": "BTC/USDT",
@@ -230,14 +208,10 @@ def run_tests(api_url: str = "http://localhost:8080"):
             },
             priority="CRITICAL"
         )
-        print_response(response)
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-
-    # Test 7: Custom event
-    try:
-        print("\n7. Custom Event - Market sentiment")
-        response = publisher.publish_event(
+    ),
+    (
+        "Custom Event - Market sentiment",
+        dict(
             event_type="market_sentiment",
             data={
                 "sentiment": "bullish",
@@ -246,27 +220,76 @@ def run_tests(api_url: str = "http://localhost:8080"):
             },
             priority="MEDIUM"
         )
-        print_response(response)
-    except Exception as e:
-        print(f"✗ Failed: {e}")
+    ),
+]
 
-    print(f"\n{'='*70}")
+
+async def run_tests(api_url: str = "http://localhost:8080"):
+    """
+    Run test event publishing.
+
+    All test events are sent concurrently over one session; results are
+    printed in order once they have all completed.
+
+    Args:
+        api_url: API base URL
+    """
+    print(_SEP70)
+    print("Event Publisher - Test Suite (GenericEvent)")
+    print(_SEP70)
+    print(f"Target: {api_url}\n")
+
+    async with EventPublisher(api_url) as publisher:
+        # Health check
+        try:
+            health = await publisher.health_check()
+            print(f"✓ Service is healthy: {health.get('status')}\n")
+        except Exception as e:
+            print(f"✗ Service unreachable: {e}")
+            print("\nMake sure the service is running:")
+            print("  python main.py")
+            sys.exit(1)
+
+        print("Sending test events...\n")
+
+        results = await asyncio.gather(
+            *(publisher.publish_event(**kwargs) for _, kwargs in TEST_EVENTS),
+            return_exceptions=True
+        )
+
+    for i, ((description, _), result) in enumerate(zip(TEST_EVENTS, results), start=1):
+        if i > 1:
+            print()
+        print(f"{i}. {description}")
+        if isinstance(result, Exception):
+            print(f"✗ Failed: {result}")
+        else:
+            print_response(result)
+
+    print(f"\n{_SEP70}")
     print("Test suite completed!")
-    print(f"{'='*70}\n")
+    print(f"{_SEP70}\n")
+
+
+async def _publish_once(api_url: str, **kwargs) -> dict:
+    """Publish a single event over a short-lived session."""
+    async with EventPublisher(api_url) as publisher:
+        return await publisher.publish_event(**kwargs)
 
 
 def interactive_mode(api_url: str = "http://localhost:8080"):
     """
     Interactive mode for manual event publishing.
 
+    The prompt loop stays synchronous so Ctrl+C at a prompt raises
+    KeyboardInterrupt; each publish runs in its own asyncio.run().
+
     Args:
         api_url: API base URL
     """
-    publisher = EventPublisher(api_url)
-
-    print(f"{'='*70}")
+    print(_SEP70)
     print("Event Publisher - Interactive Mode")
-    print(f"{'='*70}\n")
+    print(f"{_SEP70}\n")
 
     print("Enter event details (or 'q' to quit):\n")
 
@@ -286,12 +309,13 @@ def interactive_mode(api_url: str = "http://localhost:8080"):
             threshold_str = input().strip()
             threshold = json.loads(threshold_str) if threshold_str else None
 
-            response = publisher.publish_event(
+            response = asyncio.run(_publish_once(
+                api_url,
                 event_type=event_type,
                 data=data,
                 priority=priority,
                 notify_threshold=threshold
-            )
+            ))
             print_response(response)
             print()
 
@@ -325,4 +349,4 @@ if __name__ == "__main__":
     if mode == "interactive":
         interactive_mode(api_url)
     else:
-        run_tests(api_url)
+        asyncio.run(run_tests(api_url))